@@ -5,19 +5,67 @@
 ##-------------------------------##
 
 ## Imports
-from .game_object import (
-    GameObject, Player, Structure,
-    GameObjectProperty, DurabilityProperty, StageProperty,
-    TreeProperty, FlowerProperty,
-)
-from .plot import Plot
-from .tile import Tile
-from .world import Gamemode, GameOptions, World
+from __future__ import annotations
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .game_object import (
+        GameObject, Player, Structure,
+        GameObjectProperty, DurabilityProperty, StageProperty,
+        TreeProperty, FlowerProperty,
+        StructureObjectProperty, AssemblyProperty, FuelProperty, StorageProperty,
+    )
+    from .journal import Journal
+    from .navigation import DistanceField, distance_field, label_components, passable_mask
+    from .plot import Plot
+    from .terrain import Terrain
+    from .tile import Tile
+    from .validation import Diagnostic, Severity, validate_dict, validate_file
+    from .watch import Change, ChangeKind, Watcher
+    from .world import Gamemode, GameOptions, World
 
 ## Constants
 __all__: tuple[str, ...] = (
     "Gamemode", "GameOptions", "GameObject", "Player",
-    "Plot", "Structure", "Tile", "World",
+    "Journal", "Plot", "Structure", "Terrain", "Tile", "World",
     "GameObjectProperty", "DurabilityProperty", "StageProperty",
-    "TreeProperty", "FlowerProperty"
+    "TreeProperty", "FlowerProperty",
+    "StructureObjectProperty", "AssemblyProperty", "FuelProperty", "StorageProperty",
+    "Diagnostic", "Severity", "validate_dict", "validate_file",
+    "DistanceField", "distance_field", "label_components", "passable_mask",
+    "Change", "ChangeKind", "Watcher",
 )
+# -Submodule of every export; imported on first access so `python -m autonauts`
+# only pays for the modules a command uses
+_EXPORTS: dict[str, str] = {
+    **dict.fromkeys((
+        "GameObject", "Player", "Structure",
+        "GameObjectProperty", "DurabilityProperty", "StageProperty",
+        "TreeProperty", "FlowerProperty",
+        "StructureObjectProperty", "AssemblyProperty", "FuelProperty", "StorageProperty",
+    ), "game_object"),
+    "Journal": "journal",
+    **dict.fromkeys((
+        "DistanceField", "distance_field", "label_components", "passable_mask",
+    ), "navigation"),
+    "Plot": "plot",
+    "Terrain": "terrain",
+    "Tile": "tile",
+    **dict.fromkeys(("Diagnostic", "Severity", "validate_dict", "validate_file"), "validation"),
+    **dict.fromkeys(("Change", "ChangeKind", "Watcher"), "watch"),
+    **dict.fromkeys(("Gamemode", "GameOptions", "World"), "world"),
+}
+
+
+## Functions
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value: Any = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
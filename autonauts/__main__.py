@@ -5,15 +5,221 @@
 ##-------------------------------##
 
 ## Imports
+from __future__ import annotations
+import argparse
+import sys
+import time
+from collections.abc import Callable, Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from .world import World
+from .constants import FORMATS
 
-## Constants
-SAVE = Path("./docs/Saves/Test/World.txt")
+if TYPE_CHECKING:
+    from .world import World
 
 
 ## Functions
+def load_world(file: Path) -> World:
+    """Load a save in any supported format"""
+    from .codec import load_dict
+    from .world import World
+    return World.from_dict(load_dict(file))
+
+
+def save_world(world: World, file: Path, _format: str) -> None:
+    from .codec import dump_dict
+    dump_dict(world.to_dict(), file, _format)
+
+
+def command_info(args: argparse.Namespace) -> int:
+    for file in args.files:
+        world = load_world(file)
+        visible: int = sum(plot.visible for plot in world.plots)
+        objects: int = sum(1 for _ in world.objects())
+        print(
+            f"{file}: \"{world.name}\" {world.width}x{world.height} "
+            f"seed={world.seed} mode={world.gamemode.name} "
+            f"plots={visible}/{len(world.plots)} objects={objects} "
+            f"structures={len(world.structures())}"
+        )
+    return 0
+
+
+def command_query(args: argparse.Namespace) -> int:
+    from .journal import property_owner
+    world = load_world(args.file)
+    ids: set[str] | None = set(args.id) if args.id else None
+    count: int = 0
+    for obj, (x, y) in world.objects():
+        if ids is not None and obj.id not in ids:
+            continue
+        if args.region is not None:
+            x0, y0, x1, y1 = args.region
+            if not (x0 <= x <= x1 and y0 <= y <= y1):
+                continue
+        value: str = ""
+        if args.property is not None:
+            try:
+                value = f" {args.property}={getattr(property_owner(obj, args.property), args.property)!r}"
+            except AttributeError:
+                continue
+        print(f"{obj.uid}\t{obj.id}\t({x}, {y}){value}")
+        count += 1
+    print(f"{count} object(s)", file=sys.stderr)
+    return 0
+
+
+def command_paint(args: argparse.Namespace) -> int:
+    from .codec import load_dict_format
+    from .world import World
+    data, _format = load_dict_format(args.file)
+    world = World.from_dict(data)
+    x0, y0, x1, y1 = args.region
+    x0, x1 = min(x0, x1), max(x0, x1)
+    y0, y1 = min(y0, y1), max(y0, y1)
+    if x0 < 0 or y0 < 0 or x1 >= world.width or y1 >= world.height:
+        print(
+            f"error: region ({x0}, {y0})-({x1}, {y1}) is outside the "
+            f"{world.width}x{world.height} map", file=sys.stderr
+        )
+        return 1
+    for y in range(y0, y1 + 1):
+        for x in range(x0, x1 + 1):
+            world.paint(x, y, args.tile)
+    output: Path = args.output if args.output is not None else args.file
+    save_world(world, output, args.format or _format)
+    print(f"Painted {len(world.journal)} tile(s) -> {output}")
+    return 0
+
+
+def command_diff(args: argparse.Namespace) -> int:
+    old, new = load_world(args.old), load_world(args.new)
+    if old.size != new.size:
+        print(f"size: {old.width}x{old.height} -> {new.width}x{new.height}")
+    else:
+        changed: int = sum(
+            a != b for a, b in zip(old.tile_ids(), new.tile_ids())
+        )
+        print(f"tiles: {changed} changed")
+    before = { obj.uid: (obj, position) for obj, position in old.objects() }
+    after = { obj.uid: (obj, position) for obj, position in new.objects() }
+    for uid in before.keys() - after.keys():
+        obj, position = before[uid]
+        print(f"- {uid}\t{obj.id}\t{position}")
+    for uid in after.keys() - before.keys():
+        obj, position = after[uid]
+        print(f"+ {uid}\t{obj.id}\t{position}")
+    for uid in before.keys() & after.keys():
+        (a, a_position), (b, b_position) = before[uid], after[uid]
+        if a_position != b_position:
+            print(f"> {uid}\t{a.id}\t{a_position} -> {b_position}")
+        elif a.to_dict(a_position) != b.to_dict(b_position):
+            print(f"~ {uid}\t{a.id}\t{a_position}")
+    if old.player.position != new.player.position:
+        print(f"> player\t{old.player.position} -> {new.player.position}")
+    return 0
+
+
+def command_validate(args: argparse.Namespace) -> int:
+    from .codec import load_dict
+    from .validation import validate_dict
+    status: int = 0
+    for file in args.files:
+        diagnostics = validate_dict(load_dict(file))
+        for diagnostic in diagnostics:
+            print(f"{file}: {diagnostic}")
+        if any(diagnostic.is_error for diagnostic in diagnostics):
+            status = 1
+    return status
+
+
+def command_convert(args: argparse.Namespace) -> int:
+    from .codec import dump_dict, load_dict
+    dump_dict(load_dict(args.input), args.output, args.format, args.indent)
+    return 0
+
+
+def command_bench(args: argparse.Namespace) -> int:
+    from .codec import load_dict
+    from .terrain import Terrain
+    from .validation import validate_dict
+    from .world import World
+    phases: dict[str, list[float]] = {}
+
+    def timed(name: str, function: Callable[[], object]) -> object:
+        start: float = time.perf_counter()
+        result = function()
+        phases.setdefault(name, []).append(time.perf_counter() - start)
+        return result
+
+    for _ in range(args.repeat):
+        data = timed("read+parse", lambda: load_dict(args.file))
+        timed("validate", lambda: validate_dict(data))
+        world = timed("from_dict", lambda: World.from_dict(data))
+        timed("to_dict", world.to_dict)
+        timed("terrain", lambda: Terrain.from_dict(data))
+    for name, times in phases.items():
+        print(f"{name:<12}best={min(times) * 1000:8.2f}ms  mean={sum(times) / len(times) * 1000:8.2f}ms")
+    return 0
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="autonauts", description="Inspect and edit Autonauts saves"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    # -Info
+    info = commands.add_parser("info", help="summarise one or more saves")
+    info.add_argument("files", type=Path, nargs='+')
+    info.set_defaults(function=command_info)
+    # -Query
+    query = commands.add_parser("query", help="list objects by id, property or region")
+    query.add_argument("file", type=Path)
+    query.add_argument("--id", action='append', help="object id (repeatable)")
+    query.add_argument("--property", help="only objects with this property; prints its value")
+    query.add_argument(
+        "--region", type=int, nargs=4, metavar=("X0", "Y0", "X1", "Y1"),
+        help="inclusive tile rectangle"
+    )
+    query.set_defaults(function=command_query)
+    # -Paint
+    paint = commands.add_parser("paint", help="set every tile in a rectangle to a tile id")
+    paint.add_argument("file", type=Path)
+    paint.add_argument("region", type=int, nargs=4, metavar=("X0", "Y0", "X1", "Y1"))
+    paint.add_argument("tile", type=int)
+    paint.add_argument("-o", "--output", type=Path, help="write here instead of in place")
+    paint.add_argument("--format", choices=FORMATS, help="output format (default: input's)")
+    paint.set_defaults(function=command_paint)
+    # -Diff
+    diff = commands.add_parser("diff", help="compare terrain and objects of two saves")
+    diff.add_argument("old", type=Path)
+    diff.add_argument("new", type=Path)
+    diff.set_defaults(function=command_diff)
+    # -Validate
+    validate = commands.add_parser("validate", help="check saves for structural errors")
+    validate.add_argument("files", type=Path, nargs='+')
+    validate.set_defaults(function=command_validate)
+    # -Convert
+    convert = commands.add_parser("convert", help="rewrite a save in another format")
+    convert.add_argument("input", type=Path)
+    convert.add_argument("output", type=Path)
+    convert.add_argument("--format", choices=FORMATS, default="plain")
+    convert.add_argument("--indent", type=int)
+    convert.set_defaults(function=command_convert)
+    # -Bench
+    bench = commands.add_parser("bench", help="time load, validate and save phases")
+    bench.add_argument("file", type=Path)
+    bench.add_argument("-n", "--repeat", type=int, default=5)
+    bench.set_defaults(function=command_bench)
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    return args.function(args)
+
 
 ## Body
-my_world = World.from_file(SAVE)
+if __name__ == "__main__":
+    sys.exit(main())
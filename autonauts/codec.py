@@ -0,0 +1,101 @@
+#!/usr/bin/python
+##-------------------------------##
+## Autonauts Save Editor         ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Codec                         ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import gzip
+import json
+from pathlib import Path
+
+from .constants import FORMATS
+
+## Constants
+__all__: tuple[str, ...] = (
+    "FORMATS", "detect_format", "load_dict", "load_dict_format", "dump_dict",
+    "to_columnar", "from_columnar",
+)
+COLUMNS_KEY: str = "ObjectColumns"
+GZIP_MAGIC: bytes = b"\x1f\x8b"
+
+
+## Functions
+def detect_format(raw: bytes) -> str:
+    """Return the format name of raw save bytes"""
+    return _parse(raw)[1]
+
+
+def load_dict(file: Path) -> dict:
+    """
+    Load a save in any supported format as the game's unpacked json
+    - compressed saves are gzipped json of either other format
+    """
+    return load_dict_format(file)[0]
+
+
+def load_dict_format(file: Path) -> tuple[dict, str]:
+    """Load a save as the game's unpacked json along with its format name"""
+    data, _format = _parse(file.read_bytes())
+    if COLUMNS_KEY in data:
+        data = from_columnar(data)
+    return (data, _format)
+
+
+def _parse(raw: bytes) -> tuple[dict, str]:
+    '''Parse raw save bytes; the format is decided by the top-level keys, not a byte search'''
+    _format: str = "plain"
+    if raw[:2] == GZIP_MAGIC:
+        raw = gzip.decompress(raw)
+        _format = "compressed"
+    data: dict = json.loads(raw)
+    if _format == "plain" and COLUMNS_KEY in data:
+        _format = "columnar"
+    return (data, _format)
+
+
+def dump_dict(
+    data: dict, file: Path, _format: str = "plain", indent: int | None = None
+) -> None:
+    """Write the game's unpacked json to disk in a given format"""
+    if _format == "plain":
+        file.write_text(json.dumps(data, indent=indent))
+    elif _format == "compressed":
+        file.write_bytes(gzip.compress(json.dumps(data, indent=indent).encode()))
+    elif _format == "columnar":
+        file.write_text(json.dumps(to_columnar(data), indent=indent))
+    else:
+        raise ValueError(f"Unknown save format '{_format}', expected one of {FORMATS}")
+
+
+def to_columnar(data: dict) -> dict:
+    """
+    Convert the object list to sparse columns: each key stores the indices
+    of the objects that have it alongside their values
+    """
+    objects = data['Objects']
+    columns: dict[str, dict[str, list]] = {}
+    for i, obj in enumerate(objects):
+        for key, value in obj.items():
+            if key not in columns:
+                columns[key] = { 'Rows': [], 'Values': [] }
+            columns[key]['Rows'].append(i)
+            columns[key]['Values'].append(value)
+    columnar: dict = { key: value for key, value in data.items() if key != 'Objects' }
+    columnar[COLUMNS_KEY] = { 'Count': len(objects), 'Columns': columns }
+    return columnar
+
+
+def from_columnar(data: dict) -> dict:
+    """Convert sparse object columns back to the game's object list"""
+    _columns = data[COLUMNS_KEY]
+    objects: list[dict] = [{} for _ in range(_columns['Count'])]
+    for key, column in _columns['Columns'].items():
+        for i, value in zip(column['Rows'], column['Values']):
+            objects[i][key] = value
+    plain: dict = { key: value for key, value in data.items() if key != COLUMNS_KEY }
+    plain['Objects'] = objects
+    return plain
@@ -0,0 +1,11 @@
+#!/usr/bin/python
+##-------------------------------##
+## Autonauts Save Editor         ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Constants                     ##
+##-------------------------------##
+
+## Constants
+__all__: tuple[str, ...] = ("FORMATS",)
+FORMATS: tuple[str, ...] = ("plain", "compressed", "columnar")
@@ -8,16 +8,20 @@
 
 ## Imports
 from __future__ import annotations
+from collections import Counter
 from enum import IntEnum
-from typing import ClassVar, Protocol
+from threading import Lock
+from typing import ClassVar, Protocol, TypeVar
 
 ## Constants
 __all__: tuple[str, ...] = (
     "GameObject", "Player", "Structure",
     "GameObjectProperty", "DurabilityProperty", "StageProperty",
-    "TreeProperty", "FlowerProperty"
-    "load_game_object"
+    "TreeProperty", "FlowerProperty",
+    "StructureObjectProperty", "AssemblyProperty", "FuelProperty", "StorageProperty",
+    "load_game_object",
 )
+StructureObjectPropertyT = TypeVar("StructureObjectPropertyT", bound="StructureObjectProperty")
 
 
 ## Functions
@@ -43,7 +47,7 @@ class GameObject:
     def __init__(
         self, _id: str, uid: int | None = None, *properties: GameObjectProperty
     ) -> None:
-        self.uid: int = uid if uid else GameObject.get_uid()
+        self.uid: int = GameObject.claim_uid(uid) if uid else GameObject.get_uid()
         self.id: str = _id
         self.properties: tuple[GameObjectProperty, ...] = properties
 
@@ -83,12 +87,22 @@ class GameObject:
     # -Static Methods
     @staticmethod
     def get_uid() -> int:
-        value: int = GameObject.Uid
-        GameObject.Uid += 1
+        with GameObject.UidLock:
+            value: int = GameObject.Uid
+            GameObject.Uid += 1
         return value
 
+    @staticmethod
+    def claim_uid(uid: int) -> int:
+        '''Mark a loaded uid as used so new objects never reuse it'''
+        with GameObject.UidLock:
+            if uid >= GameObject.Uid:
+                GameObject.Uid = uid + 1
+        return uid
+
     # -Class Properties
     Uid: ClassVar[int] = 1
+    UidLock: ClassVar[Lock] = Lock()
 
 
 class Player:
@@ -101,7 +115,7 @@ class Player:
         self, position: tuple[int, int], rotation: int,
         uid: int | None = None, **inventory: list[GameObject]
     ) -> None:
-        self.uid: int = uid if uid else GameObject.get_uid()
+        self.uid: int = GameObject.claim_uid(uid) if uid else GameObject.get_uid()
         self.position: tuple[int, int] = position
         self.rotation: int = rotation
         self.hands: list[GameObject] = inventory['hands'] if 'hands' in inventory else []
@@ -184,25 +198,56 @@ class Player:
 
 class Structure:
     """
+    A GameObject representing a building and its state (assembly, storage, fuel)
+    - Save keys not understood by a property are kept so structures round-trip
     """
 
     # -Constructor
     def __init__(
         self, _id: str, position: tuple[int, int], rotation: int, flipped: bool,
         uid: int | None = None, name: str | None = None,
-        *properties: StructureObjectProperties
+        *properties: StructureObjectProperty, extra: dict | None = None
     ) -> None:
         self.id: str = _id
-        self.uid: int = uid if uid else GameObject.get_uid()
+        self.uid: int = GameObject.claim_uid(uid) if uid else GameObject.get_uid()
         self.name: str | None = name
         self.position: tuple[int, int] = position
         self.rotation: int = rotation
         self.flipped: bool = flipped
-        self.properties: tuple[StructureObjectProperties, ...] = properties
+        self.properties: tuple[StructureObjectProperty, ...] = properties
+        self.extra: dict = {} if extra is None else extra
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        if self.properties:
+            properties = ", ".join(f"({_property})" for _property in self.properties)
+        else:
+            properties = None
+        return f"Structure(Id=\"{self.id}\", Uid={self.uid}, Properties={properties})"
+
+    def __str__(self) -> str:
+        return self.id
 
     # -Instance Methods
-    def to_dict(self) -> dict:
-        pass
+    def to_dict(self, position: tuple[int, int] | None = None) -> dict:
+        position = self.position if position is None else position
+        data = GameObject(self.id, self.uid).to_dict(position)
+        data.update(self.extra)
+        data.update({ 'Rotation': self.rotation, 'F': int(self.flipped) })
+        if self.name is not None:
+            data['Name'] = self.name
+        for _property in self.properties:
+            data.update(_property.to_dict(position))
+        return data
+
+    def get_property(
+        self, kind: type[StructureObjectPropertyT]
+    ) -> StructureObjectPropertyT | None:
+        '''Return the first property of a given type, if the structure has one'''
+        for _property in self.properties:
+            if isinstance(_property, kind):
+                return _property
+        return None
 
     # -Class Methods
     @classmethod
@@ -212,18 +257,16 @@ class Structure:
         name: str | None = data.get('Name', None)
         position: tuple[int, int] = (data['TX'], data['TY'])
         rotation: int = data['Rotation']
-        flipped: bool = data['F']
+        flipped: bool = bool(data['F'])
         properties: list[StructureObjectProperty] = []
+        used: set[str] = set(Structure.Keys)
         # -Properties
-        if _id in Structure.Assembly:
-            print(f"Assembly Structure[{_id}]\t", end='')
-            properties.append(AssemblyProperty.from_dict(data))
-        if _id in Structure.Storage:
-            print(f"Storage[{_id}]:\t", end='')
-            print(f"data = {data}")
-        if properties:
-            print(properties)
-        return cls(_id, position, rotation, flipped, uid, name, properties)
+        for property_check in STRUCTURE_PROPERTY_CHECKS:
+            if property_check.data_has_property(_id, data):
+                properties.append(property_check.from_dict(data))
+                used.update(property_check.Keys)
+        extra: dict = { key: value for key, value in data.items() if key not in used }
+        return cls(_id, position, rotation, flipped, uid, name, *properties, extra=extra)
 
     # -Properties
     @property
@@ -286,6 +329,7 @@ class Structure:
         # -Property-Driven
         *Assembly, *Fueled, *Storage
     ))
+    Keys: ClassVar[tuple[str, ...]] = ("ID", "UID", "TX", "TY", "Rotation", "F", "Name")
 
 ## -Properties: Object
 class GameObjectProperty(Protocol):
@@ -430,47 +474,174 @@ class FlowerProperty(GameObjectProperty):
 ## -Properties: Structure
 class StructureObjectProperty(Protocol):
     # -Instance Methods
-    def to_dict(self) -> dict: ...
+    def to_dict(self, position: tuple[int, int]) -> dict: ...
     # -Class Methods
     @classmethod
     def from_dict(cls, data: dict) -> StructureObjectProperty: ...
+    # -Static Methods
+    @staticmethod
+    def data_has_property(_id: str, data: dict) -> bool: ...
+    # -Class Properties
+    Keys: ClassVar[tuple[str, ...]]
 
 
 class AssemblyProperty(StructureObjectProperty):
-    """"""
+    """
+    Structure Assembly Property: output, craft count, state and ingredients
+    - Plain ingredients are kept as an item id counter plus the uids of each
+    item id, reused in order on save (new ones are issued as needed)
+    - Ingredients with state beyond ID/UID/TX/TY are kept as verbatim records
+    """
     # -Constructor
     def __init__(
         self, output: str | None, craft_count: int,
-        is_crafting: bool, ingredients: list[GameObject]
+        is_crafting: bool, ingredients: Counter[str] | None = None,
+        uids: dict[str, list[int]] | None = None, records: list[dict] | None = None
     ) -> None:
         self.output: str | None = output
         self.craft_count: int = craft_count
         self.is_crafting: bool = is_crafting
-        self.ingredients: list[GameObject] = ingredients
+        self.ingredients: Counter[str] = Counter() if ingredients is None else ingredients
+        self.uids: dict[str, list[int]] = {} if uids is None else uids
+        self.records: list[dict] = [] if records is None else records
 
     # -Dunder Methods
     def __repr__(self) -> str:
-        return f"Output: '{self.output}'; Crafted: {self.craft_count} ; Ingredients: {self.ingredients}"
+        return f"Output: '{self.output}'; Crafted: {self.craft_count} ; Ingredients: {dict(self.ingredients)}"
 
     # -Instance Methods
-    def to_dict(self) -> dict:
-        pass
+    def to_dict(self, position: tuple[int, int]) -> dict:
+        items: list[dict] = [
+            GameObject(_id, self._ingredient_uid(_id, i)).to_dict(position)
+            for _id, count in self.ingredients.items() for i in range(count)
+        ]
+        items.extend(
+            { **record, 'TX': position[0], 'TY': position[1] } for record in self.records
+        )
+        return {
+            'ToCreateItem': self.output if self.output is not None else "Total",
+            'NumCreated': self.craft_count,
+            'State': int(self.is_crafting),
+            'IngredientsItems': tuple(items),
+        }
+
+    def _ingredient_uid(self, _id: str, index: int) -> int:
+        uids: list[int] = self.uids.setdefault(_id, [])
+        while index >= len(uids):
+            uids.append(GameObject.get_uid())
+        return uids[index]
 
     # -Class Methods
     @classmethod
-    def from_dict(cls, data: dict) -> WorkbenchProperty:
+    def from_dict(cls, data: dict) -> AssemblyProperty:
         output: str | None = data['ToCreateItem']
         if output == "Total":
             output = None
         craft_count: int = data['NumCreated']
         is_crafting: bool = bool(data['State'])
-        ingredients: list[GameObject] = [
-            GameObject.from_dict(_data) for _data in data['IngredientsItems']
-        ]
-        return cls(output, craft_count, is_crafting, ingredients)
+        ingredients: Counter[str] = Counter()
+        uids: dict[str, list[int]] = {}
+        records: list[dict] = []
+        for _data in data['IngredientsItems']:
+            GameObject.claim_uid(_data['UID'])
+            if _data.keys() - AssemblyProperty.IngredientKeys:
+                records.append(_data)
+                continue
+            ingredients[_data['ID']] += 1
+            uids.setdefault(_data['ID'], []).append(_data['UID'])
+        return cls(output, craft_count, is_crafting, ingredients, uids, records)
+
+    # -Static Methods
+    @staticmethod
+    def data_has_property(_id: str, data: dict) -> bool:
+        return _id in Structure.Assembly and 'IngredientsItems' in data
+
+    # -Properties
+    @property
+    def highest_uid(self) -> int:
+        return max(
+            max((max(uids, default=0) for uids in self.uids.values()), default=0),
+            max((record['UID'] for record in self.records), default=0)
+        )
+
+    # -Class Properties
+    Keys: ClassVar[tuple[str, ...]] = (
+        "ToCreateItem", "NumCreated", "State", "IngredientsItems"
+    )
+    IngredientKeys: ClassVar[frozenset[str]] = frozenset(("ID", "UID", "TX", "TY"))
+
+
+class FuelProperty(StructureObjectProperty):
+    """Structure Fuel Property: fuel remaining"""
+    # -Constructor
+    def __init__(self, fuel: float) -> None:
+        self.fuel: float = fuel
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"Fuel={self.fuel}"
+
+    # -Instance Methods
+    def to_dict(self, position: tuple[int, int]) -> dict:
+        return { FuelProperty.Key: self.fuel }
+
+    # -Class Methods
+    @classmethod
+    def from_dict(cls, data: dict) -> FuelProperty:
+        return cls(data[FuelProperty.Key])
+
+    # -Static Methods
+    @staticmethod
+    def data_has_property(_id: str, data: dict) -> bool:
+        return _id in Structure.Fueled and FuelProperty.Key in data
+
+    # -Class Properties
+    Key: ClassVar[str] = "Fuel"
+    Keys: ClassVar[tuple[str, ...]] = (Key,)
+
+
+class StorageProperty(StructureObjectProperty):
+    """Structure Storage Property: stored item id and count"""
+    # -Constructor
+    def __init__(self, item: str | None, count: int) -> None:
+        self.item: str | None = item
+        self.count: int = count
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"Item={self.item};Count={self.count}"
+
+    # -Instance Methods
+    def to_dict(self, position: tuple[int, int]) -> dict:
+        return {
+            StorageProperty.ItemKey: self.item if self.item is not None else "",
+            StorageProperty.CountKey: self.count,
+        }
+
+    # -Class Methods
+    @classmethod
+    def from_dict(cls, data: dict) -> StorageProperty:
+        item: str | None = data[StorageProperty.ItemKey] or None
+        return cls(item, data[StorageProperty.CountKey])
+
+    # -Static Methods
+    @staticmethod
+    def data_has_property(_id: str, data: dict) -> bool:
+        return (
+            _id in Structure.Storage
+            and StorageProperty.ItemKey in data and StorageProperty.CountKey in data
+        )
+
+    # -Class Properties
+    ItemKey: ClassVar[str] = "ObjectType"
+    CountKey: ClassVar[str] = "Stored"
+    Keys: ClassVar[tuple[str, ...]] = (ItemKey, CountKey)
 
 
 ## Body
 PROPERTY_CHECKS: tuple[type[GameObjectProperty], ...] = (
     DurabilityProperty, StageProperty, TreeProperty, FlowerProperty
 )
+STRUCTURE_PROPERTY_CHECKS: tuple[type[StructureObjectProperty], ...] = (
+    AssemblyProperty, FuelProperty, StorageProperty
+)
@@ -0,0 +1,265 @@
+#!/usr/bin/python
+##-------------------------------##
+## Autonauts Save Editor         ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Journal                       ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from .game_object import GameObject, Player, Structure
+    from .world import World
+
+## Constants
+__all__: tuple[str, ...] = (
+    "Journal", "Operation",
+    "PaintOperation", "AddOperation", "RemoveOperation",
+    "MoveOperation", "PropertyOperation", "BatchOperation",
+)
+
+
+## Functions
+def property_owner(obj: Any, name: str) -> Any:
+    """Return the object (or one of its properties) that owns an attribute"""
+    if hasattr(obj, name):
+        return obj
+    for _property in getattr(obj, 'properties', ()):
+        if hasattr(_property, name):
+            return _property
+    raise AttributeError(f"{obj!r} has no property '{name}'")
+
+
+## Classes
+class Journal:
+    """
+    Autonauts Edit Journal
+    - Stores the operations applied to a world so they can be undone,
+    redone, rolled back to a named checkpoint or replayed onto another world
+    """
+
+    # -Constructor
+    def __init__(self) -> None:
+        self.operations: list[Operation] = []
+        self.cursor: int = 0
+        self.checkpoints: dict[str, int] = {}
+
+    # -Dunder Methods
+    def __len__(self) -> int:
+        return len(self.operations)
+
+    def __repr__(self) -> str:
+        return f"Journal(Operations={len(self.operations)}, Cursor={self.cursor})"
+
+    # -Instance Methods
+    def record(self, operation: Operation) -> None:
+        '''Record an applied operation, discarding anything that could be redone'''
+        if self.cursor < len(self.operations):
+            del self.operations[self.cursor:]
+            self.checkpoints = {
+                name: cursor for name, cursor in self.checkpoints.items()
+                if cursor <= self.cursor
+            }
+        self.operations.append(operation)
+        self.cursor += 1
+
+    def undo(self, world: World, steps: int = 1) -> int:
+        '''Revert up to `steps` operations and return how many were reverted'''
+        count: int = 0
+        while count < steps and self.cursor > 0:
+            self.cursor -= 1
+            self.operations[self.cursor].revert(world)
+            count += 1
+        return count
+
+    def redo(self, world: World, steps: int = 1) -> int:
+        '''Re-apply up to `steps` undone operations and return how many were applied'''
+        count: int = 0
+        while count < steps and self.cursor < len(self.operations):
+            self.operations[self.cursor].apply(world)
+            self.cursor += 1
+            count += 1
+        return count
+
+    def checkpoint(self, name: str) -> None:
+        self.checkpoints[name] = self.cursor
+
+    def rollback(self, world: World, name: str) -> None:
+        '''Undo or redo until the journal is back at a named checkpoint'''
+        target: int = self.checkpoints[name]
+        if target < self.cursor:
+            self.undo(world, self.cursor - target)
+        else:
+            self.redo(world, target - self.cursor)
+
+    def replay(self, world: World, start: str | int = 0) -> None:
+        '''
+        Apply every operation from a checkpoint (or index) up to the cursor
+        onto another copy of the same save; objects are copied and matched by uid
+        '''
+        index: int = self.checkpoints[start] if isinstance(start, str) else start
+        for operation in self.operations[index:self.cursor]:
+            operation.apply(world, replay=True)
+
+    def clear(self) -> None:
+        self.operations.clear()
+        self.cursor = 0
+        self.checkpoints.clear()
+
+
+## -Operations
+class Operation(Protocol):
+    __slots__ = ()
+
+    # -Instance Methods
+    def apply(self, world: World, replay: bool = False) -> None: ...
+    def revert(self, world: World, replay: bool = False) -> None: ...
+
+
+class PaintOperation(Operation):
+    """Journal Operation: tile id change"""
+    __slots__ = ("position", "old", "new")
+
+    # -Constructor
+    def __init__(self, position: tuple[int, int], old: int, new: int) -> None:
+        self.position: tuple[int, int] = position
+        self.old: int = old
+        self.new: int = new
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"Paint(Position={self.position}, {self.old}->{self.new})"
+
+    # -Instance Methods
+    def apply(self, world: World, replay: bool = False) -> None:
+        world[self.position].id = self.new
+
+    def revert(self, world: World, replay: bool = False) -> None:
+        world[self.position].id = self.old
+
+
+class AddOperation(Operation):
+    """Journal Operation: object inserted onto a tile"""
+    __slots__ = ("obj", "position")
+
+    # -Constructor
+    def __init__(self, obj: Structure | GameObject, position: tuple[int, int]) -> None:
+        self.obj: Structure | GameObject = obj
+        self.position: tuple[int, int] = position
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"Add(Uid={self.obj.uid}, Position={self.position})"
+
+    # -Instance Methods
+    def apply(self, world: World, replay: bool = False) -> None:
+        world._insert(deepcopy(self.obj) if replay else self.obj, self.position)
+
+    def revert(self, world: World, replay: bool = False) -> None:
+        world._extract(world.find(self.obj.uid) if replay else self.obj)
+
+
+class RemoveOperation(Operation):
+    """Journal Operation: object removed from a tile"""
+    __slots__ = ("obj", "position", "index")
+
+    # -Constructor
+    def __init__(self, obj: Structure | GameObject, position: tuple[int, int]) -> None:
+        self.obj: Structure | GameObject = obj
+        self.position: tuple[int, int] = position
+        self.index: int | None = None
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"Remove(Uid={self.obj.uid}, Position={self.position})"
+
+    # -Instance Methods
+    def apply(self, world: World, replay: bool = False) -> None:
+        self.index = world._extract(world.find(self.obj.uid) if replay else self.obj)
+
+    def revert(self, world: World, replay: bool = False) -> None:
+        world._insert(deepcopy(self.obj) if replay else self.obj, self.position, self.index)
+
+
+class MoveOperation(Operation):
+    """Journal Operation: object moved between tiles"""
+    __slots__ = ("uid", "source", "target", "index")
+
+    # -Constructor
+    def __init__(
+        self, uid: int, source: tuple[int, int], target: tuple[int, int]
+    ) -> None:
+        self.uid: int = uid
+        self.source: tuple[int, int] = source
+        self.target: tuple[int, int] = target
+        self.index: int | None = None
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"Move(Uid={self.uid}, {self.source}->{self.target})"
+
+    # -Instance Methods
+    def apply(self, world: World, replay: bool = False) -> None:
+        self.index = world._place(world.find(self.uid), self.target)
+
+    def revert(self, world: World, replay: bool = False) -> None:
+        world._place(world.find(self.uid), self.source, self.index)
+
+
+class PropertyOperation(Operation):
+    """Journal Operation: object attribute or property value change"""
+    __slots__ = ("uid", "name", "old", "new")
+
+    # -Constructor
+    def __init__(self, uid: int, name: str, old: Any, new: Any) -> None:
+        self.uid: int = uid
+        self.name: str = name
+        self.old: Any = old
+        self.new: Any = new
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"Property(Uid={self.uid}, {self.name}: {self.old!r}->{self.new!r})"
+
+    # -Instance Methods
+    def apply(self, world: World, replay: bool = False) -> None:
+        owner = property_owner(world.find(self.uid), self.name)
+        setattr(owner, self.name, deepcopy(self.new) if replay else self.new)
+
+    def revert(self, world: World, replay: bool = False) -> None:
+        owner = property_owner(world.find(self.uid), self.name)
+        setattr(owner, self.name, deepcopy(self.old) if replay else self.old)
+
+
+class BatchOperation(Operation):
+    """Journal Operation: group of operations undone and redone as one"""
+    __slots__ = ("operations",)
+
+    # -Constructor
+    def __init__(self, operations: list[Operation]) -> None:
+        self.operations: list[Operation] = operations
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"Batch(Operations={len(self.operations)})"
+
+    # -Instance Methods
+    def apply(self, world: World, replay: bool = False) -> None:
+        '''Apply every operation; if one fails, revert those already applied'''
+        applied: int = 0
+        try:
+            for operation in self.operations:
+                operation.apply(world, replay)
+                applied += 1
+        except Exception:
+            for operation in reversed(self.operations[:applied]):
+                operation.revert(world, replay)
+            raise
+
+    def revert(self, world: World, replay: bool = False) -> None:
+        for operation in reversed(self.operations):
+            operation.revert(world, replay)
@@ -0,0 +1,272 @@
+#!/usr/bin/python
+##-------------------------------##
+## Autonauts Save Editor         ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Navigation                    ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+from array import array
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from .tile import BUILTIN_NAME_LOOKUP
+
+if TYPE_CHECKING:
+    from .terrain import Terrain
+    from .world import World
+
+## Constants
+__all__: tuple[str, ...] = (
+    "DistanceField", "WALKABLE", "WATER",
+    "tile_ids_by_name", "tiles_with_ids", "passable_mask",
+    "distance_field", "label_components",
+)
+
+
+## Functions
+def tile_ids_by_name(*names: str) -> frozenset[int]:
+    """Return the tile ids for builtin tile names (e.g. "Fresh Water")"""
+    lookup: dict[str, int] = { name: _id for _id, name in BUILTIN_NAME_LOOKUP.items() }
+    missing = [name for name in names if name not in lookup]
+    if missing:
+        raise KeyError(f"Unknown tile name(s): {', '.join(missing)}")
+    return frozenset(lookup[name] for name in names)
+
+
+def tiles_with_ids(world: World | Terrain, ids: Iterable[int]) -> list[tuple[int, int]]:
+    """Return the (X,Y) of every tile whose id is in `ids`"""
+    mask: bytearray = _id_mask(world.tile_ids(), frozenset(ids))
+    width: int = world.width
+    positions: list[tuple[int, int]] = []
+    idx: int = mask.find(1)
+    while idx != -1:
+        positions.append((idx % width, idx // width))
+        idx = mask.find(1, idx + 1)
+    return positions
+
+
+def passable_mask(
+    world: World | Terrain, passable: Iterable[int] | None = None,
+    block_structures: bool = False
+) -> bytearray:
+    """
+    Return a row-major mask with 1 for every tile whose id is passable
+    - `passable` defaults to WALKABLE
+    - `block_structures` additionally blocks the tile of every structure (World only)
+    """
+    if block_structures and not hasattr(world, 'structures'):
+        raise TypeError(
+            f"block_structures needs a World with objects, not {type(world).__name__}"
+        )
+    ids: frozenset[int] = WALKABLE if passable is None else frozenset(passable)
+    mask: bytearray = _id_mask(world.tile_ids(), ids)
+    if block_structures:
+        for structure in world.structures():
+            mask[structure.x + structure.y * world.width] = 0
+    return mask
+
+
+def distance_field(
+    world: World | Terrain, sources: Iterable[tuple[int, int]],
+    passable: Iterable[int] | None = None, block_structures: bool = False,
+    max_distance: int | None = None, mask: bytearray | None = None
+) -> DistanceField:
+    """
+    Multi-source breadth first search over 4-connected passable tiles
+    - Sources are always seeded, even on impassable tiles (e.g. water)
+    """
+    sources = tuple(sources)
+    width: int = world.width
+    height: int = world.height
+    for x, y in sources:
+        if not (0 <= x < width and 0 <= y < height):
+            raise IndexError(f"Source ({x}, {y}) is outside {width}x{height}")
+    if mask is None:
+        mask = passable_mask(world, passable, block_structures)
+    count: int = width * height
+    limit: int = count if max_distance is None else max_distance
+    last_x: int = width - 1
+    last_row: int = count - width
+    distances: array = array('i', (-1,)) * count
+    origins: array = array('i', (-1,)) * count
+    queue: array = array('i', (0,)) * count
+    unvisited: bytearray = bytearray(mask)
+    tail: int = 0
+    for i, (x, y) in enumerate(sources):
+        idx: int = x + y * width
+        if distances[idx] == -1:
+            unvisited[idx] = 0
+            distances[idx] = 0
+            origins[idx] = i
+            queue[tail] = idx
+            tail += 1
+    head: int = 0
+    while head < tail:
+        idx = queue[head]
+        head += 1
+        distance: int = distances[idx]
+        if distance >= limit:
+            continue
+        distance += 1
+        origin: int = origins[idx]
+        x = idx % width
+        if x > 0 and unvisited[idx - 1]:
+            unvisited[idx - 1] = 0
+            distances[idx - 1] = distance
+            origins[idx - 1] = origin
+            queue[tail] = idx - 1
+            tail += 1
+        if x < last_x and unvisited[idx + 1]:
+            unvisited[idx + 1] = 0
+            distances[idx + 1] = distance
+            origins[idx + 1] = origin
+            queue[tail] = idx + 1
+            tail += 1
+        if idx >= width and unvisited[idx - width]:
+            unvisited[idx - width] = 0
+            distances[idx - width] = distance
+            origins[idx - width] = origin
+            queue[tail] = idx - width
+            tail += 1
+        if idx < last_row and unvisited[idx + width]:
+            unvisited[idx + width] = 0
+            distances[idx + width] = distance
+            origins[idx + width] = origin
+            queue[tail] = idx + width
+            tail += 1
+    return DistanceField((width, height), sources, distances, origins)
+
+
+def label_components(
+    world: World | Terrain, passable: Iterable[int] | None = None,
+    block_structures: bool = False, mask: bytearray | None = None
+) -> tuple[array, int]:
+    """
+    Label 4-connected regions of passable tiles
+    - Returns a row-major label array (-1 for impassable) and the region count
+    """
+    if mask is None:
+        mask = passable_mask(world, passable, block_structures)
+    width: int = world.width
+    count: int = width * world.height
+    last_x: int = width - 1
+    last_row: int = count - width
+    labels: array = array('i', (-1,)) * count
+    queue: array = array('i', (0,)) * count
+    unvisited: bytearray = bytearray(mask)
+    label: int = 0
+    start: int = unvisited.find(1)
+    while start != -1:
+        unvisited[start] = 0
+        labels[start] = label
+        queue[0] = start
+        head: int = 0
+        tail: int = 1
+        while head < tail:
+            idx: int = queue[head]
+            head += 1
+            x: int = idx % width
+            if x > 0 and unvisited[idx - 1]:
+                unvisited[idx - 1] = 0
+                labels[idx - 1] = label
+                queue[tail] = idx - 1
+                tail += 1
+            if x < last_x and unvisited[idx + 1]:
+                unvisited[idx + 1] = 0
+                labels[idx + 1] = label
+                queue[tail] = idx + 1
+                tail += 1
+            if idx >= width and unvisited[idx - width]:
+                unvisited[idx - width] = 0
+                labels[idx - width] = label
+                queue[tail] = idx - width
+                tail += 1
+            if idx < last_row and unvisited[idx + width]:
+                unvisited[idx + width] = 0
+                labels[idx + width] = label
+                queue[tail] = idx + width
+                tail += 1
+        label += 1
+        start = unvisited.find(1, start + 1)
+    return (labels, label)
+
+
+def _id_mask(tile_ids: array, ids: frozenset[int]) -> bytearray:
+    '''Translate tile ids to a 0/1 mask, as one bytes.translate when ids fit a byte'''
+    if max(tile_ids, default=0) < 256:
+        table: bytes = bytes(int(_id in ids) for _id in range(256))
+        return bytearray(array('B', tile_ids).tobytes().translate(table))
+    return bytearray(_id in ids for _id in tile_ids)
+
+
+## Classes
+class DistanceField:
+    """
+    Navigation Distance Field
+    - Stores the step count to the nearest source and which source that is
+    for every tile (-1 where unreachable)
+    """
+
+    # -Constructor
+    def __init__(
+        self, size: tuple[int, int], sources: tuple[tuple[int, int], ...],
+        distances: array, origins: array
+    ) -> None:
+        self.size: tuple[int, int] = size
+        self.sources: tuple[tuple[int, int], ...] = sources
+        self.distances: array = distances
+        self.origins: array = origins
+
+    # -Dunder Methods
+    def __getitem__(self, key: tuple[int, int]) -> int | None:
+        '''(X,Y) index to step count, None if unreachable'''
+        x, y = key
+        distance: int = self.distances[x + y * self.size[0]]
+        return None if distance == -1 else distance
+
+    def __repr__(self) -> str:
+        return f"DistanceField(Size={self.size[0]}x{self.size[1]}, Sources={len(self.sources)})"
+
+    # -Instance Methods
+    def nearest(self, position: tuple[int, int]) -> tuple[int, tuple[int, int]] | None:
+        '''
+        Return (steps, source) for the source nearest a tile; an unreached
+        tile (e.g. a structure) is measured from its best neighbour
+        '''
+        width, height = self.size
+        x, y = position
+        best: int = x + y * width
+        if self.distances[best] == -1:
+            best = -1
+            for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+                if 0 <= nx < width and 0 <= ny < height:
+                    idx: int = nx + ny * width
+                    if self.distances[idx] != -1 and (
+                        best == -1 or self.distances[idx] < self.distances[best]
+                    ):
+                        best = idx
+            if best == -1:
+                return None
+            return (self.distances[best] + 1, self.sources[self.origins[best]])
+        return (self.distances[best], self.sources[self.origins[best]])
+
+    def within(self, steps: int) -> list[tuple[int, int]]:
+        '''Return the (X,Y) of every tile reachable in at most `steps`'''
+        width: int = self.size[0]
+        return [
+            (idx % width, idx // width)
+            for idx, distance in enumerate(self.distances)
+            if 0 <= distance <= steps
+        ]
+
+
+## Body
+WATER: frozenset[int] = tile_ids_by_name(
+    "Fresh Water", "Fresh Water(Deep)", "Sea Water", "Sea Water(Deep)", "Swamp Water"
+)
+WALKABLE: frozenset[int] = frozenset(BUILTIN_NAME_LOOKUP) - tile_ids_by_name(
+    "Fresh Water(Deep)", "Sea Water(Deep)"
+)
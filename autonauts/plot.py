@@ -38,20 +38,27 @@ class Plot:
         return self.tiles[idx]
 
     # -Class Methods
+    @classmethod
+    def filled(cls, visible: bool, _id: int) -> Plot:
+        '''Returns a plot with every tile set to one tile id'''
+        return cls(visible, tuple(Tile(_id) for _ in range(Plot.Width * Plot.Height)))
+
     @classmethod
     def from_index(
         cls, index: int, size: tuple[int, int],
         visible: bool, tiles: Sequence[Tile]
     ) -> Plot:
         '''Returns a plot of land by given index with a list of tiles attached to plot'''
-        assert len(tiles) == size[0] * size[1]
+        if len(tiles) != size[0] * size[1]:
+            raise ValueError(f"Expected {size[0] * size[1]} tiles, got {len(tiles)}")
         _tiles: list[Tile] = []
         pos_x: int = (index % (size[0] // Plot.Width)) * Plot.Width
         pos_y: int = (index // (size[0] // Plot.Width)) * Plot.Height
         for y in range(Plot.Height):
             idx: int = pos_x + pos_y * size[0] + y * size[0]
             _tiles.extend(tiles[idx : idx + Plot.Width])
-        assert len(_tiles) == Plot.Width * Plot.Height
+        if len(_tiles) != Plot.Width * Plot.Height:
+            raise ValueError(f"Plot index {index} is outside of {size[0]}x{size[1]}")
         return cls(visible, tuple(_tiles))
 
     # -Class Properties
@@ -0,0 +1,169 @@
+#!/usr/bin/python
+##-------------------------------##
+## Autonauts Save Editor         ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Terrain                       ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import json
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import groupby
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .world import World
+
+## Constants
+__all__: tuple[str, ...] = ("Terrain",)
+
+
+## Functions
+def _append_run(tile_data: list[int], _id: int, count: int) -> None:
+    '''Append an (id, count) run, merging it into the last run if ids match'''
+    if tile_data and tile_data[-2] == _id:
+        tile_data[-1] += count
+    else:
+        tile_data.extend((_id, count))
+
+
+## Classes
+class Terrain:
+    """
+    Autonauts Terrain (compressed)
+    - Stores tile ids as the save's (id, count) runs plus a prefix sum of
+    run ends so lookups binary search the runs instead of expanding them;
+    rows are only expanded once they are edited
+    """
+
+    # -Constructor
+    def __init__(self, size: tuple[int, int], tile_data: Sequence[int]) -> None:
+        self.size: tuple[int, int] = size
+        self._ids: array = array('I')
+        self._ends: array = array('Q')
+        self._rows: dict[int, array] = {}
+        self._load_runs(tile_data)
+
+    # -Dunder Methods
+    def __getitem__(self, key: tuple[int, int]) -> int:
+        '''(X,Y) index to tile id relative to world origin'''
+        x, y = key
+        self._check_bounds(x, y)
+        if y in self._rows:
+            return self._rows[y][x]
+        return self._ids[bisect_right(self._ends, x + y * self.width)]
+
+    def __setitem__(self, key: tuple[int, int], _id: int) -> None:
+        x, y = key
+        self._check_bounds(x, y)
+        if y not in self._rows:
+            self._rows[y] = self.row(y)
+        self._rows[y][x] = _id
+
+    def __repr__(self) -> str:
+        return (
+            f"Terrain(Size={self.width}x{self.height}, Runs={self.run_count}, "
+            f"ExpandedRows={len(self._rows)})"
+        )
+
+    # -Instance Methods
+    def row(self, y: int) -> array:
+        '''Decode a single row of tile ids'''
+        if y in self._rows:
+            return array('I', self._rows[y])
+        start: int = y * self.width
+        end: int = start + self.width
+        row: array = array('I')
+        run: int = bisect_right(self._ends, start)
+        while start < end:
+            stop: int = min(self._ends[run], end)
+            row.extend(array('I', (self._ids[run],)) * (stop - start))
+            start = stop
+            run += 1
+        return row
+
+    def tile_ids(self) -> array:
+        '''Decode every tile id in row-major order'''
+        ids: array = array('I')
+        for y in range(self.height):
+            ids.extend(self.row(y))
+        return ids
+
+    def to_runs(self) -> list[int]:
+        '''Return save compatible (id, count) runs including any edited rows'''
+        tile_data: list[int] = []
+        start: int = 0
+        for y in sorted(self._rows):
+            self._extend_runs(tile_data, start, y * self.width)
+            for _id, group in groupby(self._rows[y]):
+                _append_run(tile_data, _id, sum(1 for _ in group))
+            start = (y + 1) * self.width
+        self._extend_runs(tile_data, start, self.width * self.height)
+        return tile_data
+
+    def compact(self) -> None:
+        '''Fold edited rows back into the run list'''
+        if self._rows:
+            self._load_runs(self.to_runs())
+
+    def _load_runs(self, tile_data: Sequence[int]) -> None:
+        self._ids = array('I', tile_data[0::2])
+        self._ends = array('Q')
+        total: int = 0
+        for count in tile_data[1::2]:
+            total += count
+            self._ends.append(total)
+        if total != self.width * self.height:
+            raise ValueError(
+                f"Tile runs expand to {total} tiles, expected {self.width * self.height}"
+            )
+        self._rows = {}
+
+    def _extend_runs(self, tile_data: list[int], start: int, end: int) -> None:
+        '''Append the stored runs covering tiles [start, end) to `tile_data`'''
+        run: int = bisect_right(self._ends, start)
+        while start < end:
+            stop: int = min(self._ends[run], end)
+            _append_run(tile_data, self._ids[run], stop - start)
+            start = stop
+            run += 1
+
+    def _check_bounds(self, x: int, y: int) -> None:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Position ({x}, {y}) is outside {self.width}x{self.height}")
+
+    # -Class Methods
+    @classmethod
+    def from_dict(cls, data: dict) -> Terrain:
+        '''Load only the terrain from expected unpacked json'''
+        _tiles = data['Tiles']
+        size: tuple[int, int] = (_tiles['TilesWide'], _tiles['TilesHigh'])
+        return cls(size, _tiles['TileTypes'])
+
+    @classmethod
+    def from_file(cls, file: Path) -> Terrain:
+        with file.open('r') as f:
+            data = json.load(f)
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_world(cls, world: World) -> Terrain:
+        return cls(world.size, world.to_runs())
+
+    # -Properties
+    @property
+    def run_count(self) -> int:
+        return len(self._ids)
+
+    @property
+    def height(self) -> int:
+        return self.size[1]
+
+    @property
+    def width(self) -> int:
+        return self.size[0]
@@ -0,0 +1,231 @@
+#!/usr/bin/python
+##-------------------------------##
+## Autonauts Save Editor         ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Validation                    ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import json
+from enum import Enum
+from pathlib import Path
+from typing import ClassVar
+
+from .game_object import TreeProperty
+from .plot import Plot
+from .tile import BUILTIN_NAME_LOOKUP
+
+## Constants
+__all__: tuple[str, ...] = (
+    "Diagnostic", "Severity", "validate_dict", "validate_file",
+)
+
+
+## Functions
+def validate_dict(data: dict) -> list[Diagnostic]:
+    """
+    Validate an unpacked save in a single pass over its tile runs and objects
+    and return every problem found as a list of diagnostics
+    """
+    diagnostics: list[Diagnostic] = []
+    # -Tiles
+    try:
+        _tiles = data['Tiles']
+        width: int = _tiles['TilesWide']
+        height: int = _tiles['TilesHigh']
+        tile_data = _tiles['TileTypes']
+    except (KeyError, TypeError) as e:
+        diagnostics.append(Diagnostic(
+            Severity.Error, Diagnostic.MissingKey, f"Missing tile data: {e}", "Tiles"
+        ))
+        return diagnostics
+    if not (_is_int(width) and _is_int(height)):
+        diagnostics.append(Diagnostic(
+            Severity.Error, Diagnostic.TileData,
+            f"TilesWide/TilesHigh must be integers, got {width!r}/{height!r}", "Tiles"
+        ))
+        return diagnostics
+    if not isinstance(tile_data, (list, tuple)):
+        diagnostics.append(Diagnostic(
+            Severity.Error, Diagnostic.TileData,
+            f"TileTypes must be a list, got {type(tile_data).__name__}", "Tiles.TileTypes"
+        ))
+        tile_data = ()
+    if len(tile_data) % 2:
+        diagnostics.append(Diagnostic(
+            Severity.Error, Diagnostic.TileData,
+            f"TileTypes has odd length {len(tile_data)}, expected (id, count) pairs",
+            "Tiles.TileTypes"
+        ))
+    total: int = 0
+    unknown: dict[int, int] = {}
+    for i in range(0, len(tile_data) - 1, 2):
+        _id: int = tile_data[i]
+        count: int = tile_data[i + 1]
+        if not (_is_int(_id) and _is_int(count)):
+            diagnostics.append(Diagnostic(
+                Severity.Error, Diagnostic.TileData,
+                f"Run ({_id!r}, {count!r}) is not a pair of integers",
+                f"Tiles.TileTypes[{i}]"
+            ))
+            continue
+        if count <= 0:
+            diagnostics.append(Diagnostic(
+                Severity.Error, Diagnostic.TileData,
+                f"Run of tile id {_id} has non-positive count {count}",
+                f"Tiles.TileTypes[{i + 1}]"
+            ))
+        if _id not in BUILTIN_NAME_LOOKUP:
+            unknown[_id] = unknown.get(_id, 0) + count
+        total += count
+    if total != width * height:
+        diagnostics.append(Diagnostic(
+            Severity.Error, Diagnostic.TileCount,
+            f"Tile runs sum to {total}, expected {width}x{height}={width * height}",
+            "Tiles.TileTypes"
+        ))
+    for _id, count in unknown.items():
+        diagnostics.append(Diagnostic(
+            Severity.Warning, Diagnostic.TileUnknown,
+            f"Unknown tile id {_id} used by {count} tiles", "Tiles.TileTypes"
+        ))
+    # -Plots
+    _plots = data.get('Plots')
+    plots_visible = _plots.get('PlotsVisible') if isinstance(_plots, dict) else None
+    plot_count: int = (width // Plot.Width) * (height // Plot.Height)
+    if plots_visible is None:
+        diagnostics.append(Diagnostic(
+            Severity.Error, Diagnostic.MissingKey, "Missing Plots.PlotsVisible", "Plots"
+        ))
+    elif not isinstance(plots_visible, (list, tuple)):
+        diagnostics.append(Diagnostic(
+            Severity.Error, Diagnostic.PlotCount,
+            f"PlotsVisible must be a list, got {type(plots_visible).__name__}",
+            "Plots.PlotsVisible"
+        ))
+    elif len(plots_visible) != plot_count:
+        diagnostics.append(Diagnostic(
+            Severity.Error, Diagnostic.PlotCount,
+            f"PlotsVisible has {len(plots_visible)} entries, expected {plot_count}",
+            "Plots.PlotsVisible"
+        ))
+    # -Objects
+    uids: dict[int, int] = {}
+    bees: list[tuple[int, int]] = []
+    objects = data.get('Objects', ())
+    if not isinstance(objects, (list, tuple)):
+        diagnostics.append(Diagnostic(
+            Severity.Error, Diagnostic.MissingKey,
+            f"Objects must be a list, got {type(objects).__name__}", "Objects"
+        ))
+        objects = ()
+    for i, obj in enumerate(objects):
+        path: str = f"Objects[{i}]"
+        if not isinstance(obj, dict):
+            diagnostics.append(Diagnostic(
+                Severity.Error, Diagnostic.MissingKey,
+                f"Object must be a dict, got {type(obj).__name__}", path
+            ))
+            continue
+        missing = [key for key in ('UID', 'TX', 'TY') if not _is_int(obj.get(key))]
+        if missing:
+            diagnostics.append(Diagnostic(
+                Severity.Error, Diagnostic.MissingKey,
+                f"Object is missing integer key(s) {', '.join(missing)}", path
+            ))
+            continue
+        uid: int = obj['UID']
+        x: int = obj['TX']
+        y: int = obj['TY']
+        if not (0 <= x < width and 0 <= y < height):
+            diagnostics.append(Diagnostic(
+                Severity.Error, Diagnostic.ObjectBounds,
+                f"Object '{obj.get('ID')}' (uid={uid}) at ({x}, {y}) is outside {width}x{height}",
+                path
+            ))
+        if uid in uids:
+            diagnostics.append(Diagnostic(
+                Severity.Error, Diagnostic.ObjectUid,
+                f"Duplicate uid {uid}, first used by Objects[{uids[uid]}]", path
+            ))
+        else:
+            uids[uid] = i
+        nest = obj.get(TreeProperty.BeesKey)
+        if isinstance(nest, dict) and _is_int(nest.get('UID')):
+            bees.append((i, nest['UID']))
+    for i, uid in bees:
+        if uid not in uids:
+            diagnostics.append(Diagnostic(
+                Severity.Error, Diagnostic.BeesDangling,
+                f"{TreeProperty.BeesKey} uid {uid} does not match any object",
+                f"Objects[{i}].{TreeProperty.BeesKey}"
+            ))
+    return diagnostics
+
+
+def _is_int(value: object) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def validate_file(file: Path) -> list[Diagnostic]:
+    """Load a save file from disk and validate it"""
+    with file.open('r') as f:
+        data = json.load(f)
+    return validate_dict(data)
+
+
+## Classes
+class Severity(Enum):
+    Warning = "warning"
+    Error = "error"
+
+
+class Diagnostic:
+    """
+    Save Diagnostic
+    - Stores severity, problem code, message and the path into the save
+    where the problem was found
+    """
+
+    # -Constructor
+    def __init__(
+        self, severity: Severity, code: str, message: str, path: str | None = None
+    ) -> None:
+        self.severity: Severity = severity
+        self.code: str = code
+        self.message: str = message
+        self.path: str | None = path
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"Diagnostic(Severity={self.severity.value}, Code=\"{self.code}\", Path={self.path})"
+
+    def __str__(self) -> str:
+        location: str = f" [{self.path}]" if self.path else ""
+        return f"{self.severity.value}: {self.code}{location}: {self.message}"
+
+    # -Instance Methods
+    def to_dict(self) -> dict:
+        return {
+            'Severity': self.severity.value,
+            'Code': self.code,
+            'Message': self.message,
+            'Path': self.path,
+        }
+
+    # -Properties
+    @property
+    def is_error(self) -> bool:
+        return self.severity is Severity.Error
+
+    # -Class Properties
+    MissingKey: ClassVar[str] = "missing-key"
+    TileData: ClassVar[str] = "tile-data"
+    TileCount: ClassVar[str] = "tile-count"
+    TileUnknown: ClassVar[str] = "tile-unknown"
+    PlotCount: ClassVar[str] = "plot-count"
+    ObjectBounds: ClassVar[str] = "object-bounds"
+    ObjectUid: ClassVar[str] = "object-uid"
+    BeesDangling: ClassVar[str] = "bees-dangling"
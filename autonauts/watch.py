@@ -0,0 +1,240 @@
+#!/usr/bin/python
+##-------------------------------##
+## Autonauts Save Editor         ##
+## Written By: Ryan Smith        ##
+##-------------------------------##
+## Watch                         ##
+##-------------------------------##
+
+## Imports
+from __future__ import annotations
+import json
+import os
+from collections.abc import Callable, Sequence
+from enum import Enum
+from pathlib import Path
+from threading import Event
+
+from .game_object import Player, load_game_object
+from .tile import decompress_tile_ids
+from .world import Gamemode, GameOptions, World
+
+## Constants
+__all__: tuple[str, ...] = ("Change", "ChangeKind", "Watcher")
+
+
+## Functions
+def _run_bounds(old: Sequence[int], new: Sequence[int]) -> tuple[int, int, int]:
+    '''
+    Return (first differing run, tiles before it, tiles after the last
+    differing run) for two equally sized (id, count) run lists
+    '''
+    prefix_runs: int = 0
+    prefix_tiles: int = 0
+    limit: int = min(len(old), len(new))
+    while (
+        prefix_runs < limit
+        and old[prefix_runs] == new[prefix_runs]
+        and old[prefix_runs + 1] == new[prefix_runs + 1]
+    ):
+        prefix_tiles += new[prefix_runs + 1]
+        prefix_runs += 2
+    suffix_tiles: int = 0
+    i: int = len(old) - 2
+    j: int = len(new) - 2
+    while (
+        i >= prefix_runs and j >= prefix_runs
+        and old[i] == new[j] and old[i + 1] == new[j + 1]
+    ):
+        suffix_tiles += new[j + 1]
+        i -= 2
+        j -= 2
+    return (prefix_runs, prefix_tiles, suffix_tiles)
+
+
+## Classes
+class ChangeKind(Enum):
+    Reloaded = "reloaded"
+    Options = "options"
+    Plots = "plots"
+    Tiles = "tiles"
+    Added = "added"
+    Removed = "removed"
+    Updated = "updated"
+    Player = "player"
+
+
+class Change:
+    """
+    Watch Change Event
+    - Stores what kind of section changed and which uids (objects) or
+    (X,Y) positions (tiles) or plot indices it touched
+    """
+
+    # -Constructor
+    def __init__(self, kind: ChangeKind, items: tuple = ()) -> None:
+        self.kind: ChangeKind = kind
+        self.items: tuple = items
+
+    # -Dunder Methods
+    def __repr__(self) -> str:
+        return f"Change(Kind={self.kind.value}, Items={len(self.items)})"
+
+
+class Watcher:
+    """
+    Autonauts Save Watcher
+    - Polls a save's mtime and size and, when the game rewrites it, updates
+    the previously loaded world in place: unchanged tile runs and objects
+    with identical records are kept and only the differences are rebuilt
+    """
+
+    # -Constructor
+    def __init__(self, file: Path, interval: float = 1.0) -> None:
+        self.file: Path = file
+        self.interval: float = interval
+        self.world: World | None = None
+        self._stat: tuple[int, int] | None = None
+        self._tile_data: list[int] = []
+        self._records: dict[int, dict] = {}
+        self._player: dict = {}
+        self._subscribers: list[Callable[[World, list[Change]], None]] = []
+
+    # -Instance Methods
+    def subscribe(self, callback: Callable[[World, list[Change]], None]) -> None:
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[World, list[Change]], None]) -> None:
+        self._subscribers.remove(callback)
+
+    def poll(self) -> list[Change]:
+        '''Reload the save if it changed on disk and return what changed'''
+        try:
+            stat: os.stat_result = self.file.stat()
+        except FileNotFoundError:
+            return []
+        key: tuple[int, int] = (stat.st_mtime_ns, stat.st_size)
+        if key == self._stat:
+            return []
+        try:
+            data: dict = json.loads(self.file.read_text())
+        except (OSError, ValueError):
+            # -Caught mid-write, or replaced/removed since stat; retry on the next poll
+            return []
+        self._stat = key
+        if self.world is None or not self._same_layout(data):
+            changes: list[Change] = self._reload(data)
+        else:
+            changes = self._update(data)
+        if changes:
+            for callback in tuple(self._subscribers):
+                callback(self.world, changes)
+        return changes
+
+    def run(self, stop: Event | None = None) -> None:
+        '''Poll every `interval` seconds until `stop` is set'''
+        stop = Event() if stop is None else stop
+        while not stop.is_set():
+            self.poll()
+            stop.wait(self.interval)
+
+    def _same_layout(self, data: dict) -> bool:
+        _tiles = data['Tiles']
+        return (
+            self.world is not None
+            and (_tiles['TilesWide'], _tiles['TilesHigh']) == self.world.size
+            and len(data['Plots']['PlotsVisible']) == len(self.world.plots)
+        )
+
+    def _reload(self, data: dict) -> list[Change]:
+        self.world = World.from_dict(data)
+        self._remember(data)
+        return [Change(ChangeKind.Reloaded)]
+
+    def _remember(self, data: dict) -> None:
+        self._tile_data = data['Tiles']['TileTypes']
+        self._records = {}
+        for record in data['Objects']:
+            if record['ID'] == Player.Identifier:
+                self._player = record
+            else:
+                self._records[record['UID']] = record
+
+    def _update(self, data: dict) -> list[Change]:
+        world: World = self.world
+        changes: list[Change] = []
+        # -Options
+        _options = data['GameOptions']
+        options = (
+            _options['Name'], _options['Seed'], Gamemode(_options['GameModeName']),
+            (_options['StartPositionX'], _options['StartPositionY']),
+            GameOptions.from_dict(_options),
+        )
+        if options != (world.name, world.seed, world.gamemode, world.spawn, world.options):
+            world.name, world.seed, world.gamemode, world.spawn, world.options = options
+            changes.append(Change(ChangeKind.Options))
+        # -Plots
+        plots: list[int] = []
+        visibility = data['Plots']['PlotsVisible']
+        for i, (plot, visible) in enumerate(zip(world.plots, visibility)):
+            if plot.visible != bool(visible):
+                plot.visible = bool(visible)
+                plots.append(i)
+        if plots:
+            changes.append(Change(ChangeKind.Plots, tuple(plots)))
+        # -Tiles: only decode the runs between the matching prefix and suffix
+        tile_data = data['Tiles']['TileTypes']
+        first_run, start, suffix = _run_bounds(self._tile_data, tile_data)
+        end: int = world.tile_count - suffix
+        tiles: list[tuple[int, int]] = []
+        idx: int = start
+        for _id in decompress_tile_ids(tile_data[first_run:]):
+            if idx >= end:
+                break
+            position = (idx % world.width, idx // world.width)
+            tile = world[position]
+            if tile.id != _id:
+                tile.id = _id
+                tiles.append(position)
+            idx += 1
+        if tiles:
+            changes.append(Change(ChangeKind.Tiles, tuple(tiles)))
+        # -Objects: keep every object whose uid and record are unchanged
+        records: dict[int, dict] = {}
+        player: dict = {}
+        for record in data['Objects']:
+            if record['ID'] == Player.Identifier:
+                player = record
+            else:
+                records[record['UID']] = record
+        removed = tuple(uid for uid in self._records if uid not in records)
+        for uid in removed:
+            world._extract(world.find(uid))
+        added: list[int] = []
+        updated: list[int] = []
+        for uid, record in records.items():
+            previous: dict | None = self._records.get(uid)
+            if previous == record:
+                continue
+            if previous is not None:
+                world._extract(world.find(uid))
+                updated.append(uid)
+            else:
+                added.append(uid)
+            position, obj = load_game_object(record)
+            world._insert(obj, position)
+        for kind, uids in (
+            (ChangeKind.Removed, removed), (ChangeKind.Added, added),
+            (ChangeKind.Updated, updated),
+        ):
+            if uids:
+                changes.append(Change(kind, tuple(uids)))
+        if player != self._player:
+            world.player = Player.from_dict(player)
+            changes.append(Change(ChangeKind.Player, (world.player.uid,)))
+        self._tile_data = tile_data
+        self._records = records
+        self._player = player
+        if changes:
+            world.journal.clear()
+        return changes
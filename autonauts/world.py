@@ -9,19 +9,98 @@
 ## Imports
 from __future__ import annotations
 import json
-from collections.abc import Generator
+import os
+import stat
+import tempfile
+from array import array
+from collections.abc import Callable, Generator, Iterable, Iterator
+from functools import partial
 from enum import Enum, Flag, auto
+from itertools import groupby
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, Any, ClassVar
+from weakref import WeakKeyDictionary
 
-from .game_object import GameObject, Player, Structure, load_game_object
+from .game_object import (
+    GameObject, Player, Structure, StorageProperty, TreeProperty, load_game_object
+)
+from .journal import (
+    Journal, Operation, AddOperation, BatchOperation, MoveOperation,
+    PaintOperation, PropertyOperation, RemoveOperation, property_owner,
+)
 from .plot import Plot
-from .tile import Tile, compress_tile_ids, decompress_tile_ids
+from .tile import Tile, decompress_tile_ids
+from .validation import Diagnostic, validate_dict
+
+if TYPE_CHECKING:
+    # -Imported lazily by the async API; asyncio dominates import time
+    import asyncio
+    from concurrent.futures import Executor
 
 ## Constants
 __all__: tuple[str, ...] = (
     "Gamemode", "GameOptions", "World",
 )
+_ASYNC_LIMITS: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    WeakKeyDictionary()
+)
+# -Read once at import: os.umask can only be read by setting it, which is not
+# safe while save threads are creating files
+_UMASK: int = os.umask(0o022)
+os.umask(_UMASK)
+
+
+## Functions
+def _default_limit() -> asyncio.Semaphore:
+    '''Return the shared load/save semaphore of the running event loop'''
+    import asyncio
+    loop = asyncio.get_running_loop()
+    if loop not in _ASYNC_LIMITS:
+        _ASYNC_LIMITS[loop] = asyncio.Semaphore(World.AsyncLimit)
+    return _ASYNC_LIMITS[loop]
+
+
+async def _run_to_completion(
+    executor: Executor | None, function: Callable[..., Any], *args: Any
+) -> Any:
+    '''
+    Run a call in an executor; if the awaiting task is cancelled, wait for the
+    call to finish before re-raising so the caller's concurrency slot stays
+    held while the work is still running
+    '''
+    import asyncio
+    future = asyncio.get_running_loop().run_in_executor(executor, function, *args)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        while not future.done():
+            try:
+                await asyncio.wait((future,))
+            except asyncio.CancelledError:
+                continue
+        if not future.cancelled():
+            future.exception()  # -Retrieved so it is not reported as unhandled
+        raise
+
+
+def _write_atomic(file: Path, text: str) -> None:
+    '''Write to a unique sibling temp file and swap it in so a save is never half-written'''
+    handle, temp = tempfile.mkstemp(
+        prefix=f".{file.name}.", suffix=".tmp", dir=file.parent
+    )
+    try:
+        with os.fdopen(handle, 'w') as f:
+            f.write(text)
+        # -mkstemp creates the file as 0600; keep the mode a plain write would give
+        try:
+            mode: int = stat.S_IMODE(file.stat().st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(temp, mode)
+        os.replace(temp, file)
+    finally:
+        if os.path.exists(temp):
+            os.unlink(temp)
 
 
 ## Classes
@@ -46,6 +125,10 @@ class World:
         self.options: GameOptions = flags
         self.plots: tuple[Plot, ...] = plots
         self.player: Player = player
+        self.journal: Journal = Journal()
+        self._index: dict[int, tuple[Structure | GameObject, tuple[int, int]]] = {}
+        self._structures: dict[str, dict[int, Structure]] = {}
+        self._build_index()
 
     # -Dunder Methods
     def __getitem__(self, key: tuple[int, int]) -> Tile:
@@ -57,24 +140,13 @@ class World:
     # -Instance Methods
     def to_dict(self) -> dict:
         '''Return a save file compatible dict of the world'''
-        tiles: list[int] = []
+        tiles: list[int] = self.to_runs()
         objects: list[dict] = []
-        # -Compute compressed tile ids
-        compression_gen = compress_tile_ids()
-        next(compression_gen)
         for y in range(self.height):
             for x in range(self.width):
                 position = (x, y)
-                # -Tile
-                tile = self[x, y]
-                compressed_id = compression_gen.send(tile)
-                if compressed_id:
-                    tiles.extend(compressed_id)
-                    next(compression_gen)
-                # -Objects
-                for obj in tile.objects:
+                for obj in self[x, y].objects:
                     objects.append(obj.to_dict(position))
-        tiles.extend(cast(tuple[int, int], compression_gen.send(None)))
         # -Player | Structures
         objects.append(self.player.to_dict())
         # -World format
@@ -110,10 +182,435 @@ class World:
             'Objects': tuple(objects)
         }
 
+    def to_runs(self) -> list[int]:
+        '''Return the save's compressed (id, count) tile runs'''
+        tiles: list[int] = []
+        for _id, run in groupby(self.tile_ids()):
+            tiles.extend((_id, len(list(run))))
+        return tiles
+
+    def tile_ids(self) -> array:
+        '''Return every tile id in row-major order, copied plot row by plot row'''
+        ids: array = array('I')
+        plots_wide: int = self.width // Plot.Width
+        for row in range(0, len(self.plots), plots_wide):
+            plots = self.plots[row:row + plots_wide]
+            for y in range(0, Plot.Width * Plot.Height, Plot.Width):
+                for plot in plots:
+                    ids.extend([tile.id for tile in plot.tiles[y:y + Plot.Width]])
+        return ids
+
     def to_file(self, file: Path, indent: int | None = None) -> None:
         with file.open('w') as f:
             json.dump(self.to_dict(), f, indent=indent)
 
+    async def asave(
+        self, file: Path, indent: int | None = None,
+        executor: Executor | None = None, limit: asyncio.Semaphore | None = None
+    ) -> None:
+        '''
+        Save without blocking the event loop: serialising runs in `executor`
+        and the write in a thread; at most `limit` loads/saves run at once.
+        A cancelled save keeps its slot until the running phase finishes
+        '''
+        async with limit if limit is not None else _default_limit():
+            data = await _run_to_completion(executor, self.to_dict)
+            text = await _run_to_completion(
+                executor, partial(json.dumps, indent=indent), data
+            )
+            await _run_to_completion(None, _write_atomic, file, text)
+
+    def validate(self) -> list[Diagnostic]:
+        '''Validate the save this world would write and return its diagnostics'''
+        return validate_dict(self.to_dict())
+
+    # --Editing
+    def find(self, uid: int) -> Player | Structure | GameObject:
+        '''Return the player or tile object with the given uid'''
+        if uid == self.player.uid:
+            return self.player
+        return self._locate(uid)[0]
+
+    def position(self, obj: Player | Structure | GameObject) -> tuple[int, int]:
+        '''Return the (X,Y) of the tile an object (or the player) is attached to'''
+        if obj is self.player:
+            return self.player.position
+        return self._locate(obj.uid)[1]
+
+    def paint(self, x: int, y: int, _id: int) -> None:
+        '''Change the tile id at (X,Y)'''
+        self._check_bounds((x, y))
+        self._record(PaintOperation((x, y), self[x, y].id, _id))
+
+    def add(self, obj: Structure | GameObject, x: int, y: int) -> None:
+        '''Attach an object to the tile at (X,Y)'''
+        self._record(self._add_operation(obj, (x, y)))
+
+    def remove(self, obj: Structure | GameObject) -> None:
+        '''Detach an object from its tile'''
+        self._record(self._remove_operation(obj))
+
+    def move(self, obj: Player | Structure | GameObject, x: int, y: int) -> None:
+        '''Move an object (or the player) to the tile at (X,Y)'''
+        self._record(self._move_operation(obj, (x, y)))
+
+    def add_many(
+        self, placements: Iterable[tuple[Structure | GameObject, int, int]]
+    ) -> None:
+        '''Attach many (object, X, Y) placements as a single undoable edit'''
+        placements = list(placements)
+        self._check_unique(obj for obj, _, _ in placements)
+        self._record(BatchOperation([
+            self._add_operation(obj, (x, y)) for obj, x, y in placements
+        ]))
+
+    def remove_many(self, objects: Iterable[Structure | GameObject]) -> None:
+        '''Detach many objects as a single undoable edit'''
+        objects = list(objects)
+        self._check_unique(objects)
+        self._record(BatchOperation([self._remove_operation(obj) for obj in objects]))
+
+    def move_many(
+        self, moves: Iterable[tuple[Player | Structure | GameObject, int, int]]
+    ) -> None:
+        '''Move many (object, X, Y) pairs as a single undoable edit'''
+        moves = list(moves)
+        self._check_unique(obj for obj, _, _ in moves)
+        self._record(BatchOperation([
+            self._move_operation(obj, (x, y)) for obj, x, y in moves
+        ]))
+
+    def shift(
+        self, objects: Iterable[Player | Structure | GameObject], dx: int, dy: int
+    ) -> None:
+        '''Move every object by an (X,Y) offset as a single undoable edit'''
+        objects = list(objects)
+        self._check_unique(objects)
+        operations: list[Operation] = []
+        for obj in objects:
+            x, y = self.position(obj)
+            operations.append(self._move_operation(obj, (x + dx, y + dy)))
+        self._record(BatchOperation(operations))
+
+    def set_property(
+        self, obj: Player | Structure | GameObject, name: str, value: Any
+    ) -> None:
+        '''Set an attribute of an object or of one of its properties'''
+        old: Any = getattr(property_owner(obj, name), name)
+        self._record(PropertyOperation(obj.uid, name, old, value))
+
+    def objects(self) -> Iterator[tuple[Structure | GameObject, tuple[int, int]]]:
+        '''Iterate every tile object with the (X,Y) of its tile'''
+        return iter(self._index.values())
+
+    def structures(self, *ids: str) -> list[Structure]:
+        '''Return every structure, or only those with one of the given ids'''
+        if not ids:
+            ids = tuple(self._structures)
+        return [
+            structure for _id in ids
+            for structure in self._structures.get(_id, {}).values()
+        ]
+
+    def fill_storage(
+        self, item: str | None, count: int, ids: Iterable[str] = ("StorageGeneric",)
+    ) -> int:
+        '''
+        Set the stored item and count of every storage structure with one
+        of the given ids as a single undoable edit; returns how many changed
+        '''
+        operations: list[Operation] = []
+        for structure in self.structures(*ids):
+            storage = structure.get_property(StorageProperty)
+            if storage is None:
+                continue
+            operations.append(PropertyOperation(structure.uid, 'item', storage.item, item))
+            operations.append(PropertyOperation(structure.uid, 'count', storage.count, count))
+        if operations:
+            self._record(BatchOperation(operations))
+        return len(operations) // 2
+
+    def _add_operation(
+        self, obj: Structure | GameObject, position: tuple[int, int]
+    ) -> AddOperation:
+        self._check_bounds(position)
+        if obj.uid in self._index or obj.uid == self.player.uid:
+            raise ValueError(f"An object with uid {obj.uid} is already in the world")
+        return AddOperation(obj, position)
+
+    def _remove_operation(self, obj: Structure | GameObject) -> RemoveOperation:
+        found, position = self._locate(obj.uid)
+        if found is not obj:
+            raise ValueError(f"Object {obj!r} is not the one in the world with uid {obj.uid}")
+        return RemoveOperation(obj, position)
+
+    def _move_operation(
+        self, obj: Player | Structure | GameObject, position: tuple[int, int]
+    ) -> MoveOperation:
+        self._check_bounds(position)
+        return MoveOperation(obj.uid, self.position(obj), position)
+
+    def _check_unique(self, objects: Iterable[Player | Structure | GameObject]) -> None:
+        '''Reject a batch that names the same object or uid more than once'''
+        seen: set[int] = set()
+        for obj in objects:
+            if obj.uid in seen:
+                raise ValueError(f"Uid {obj.uid} appears more than once in the batch")
+            seen.add(obj.uid)
+
+    def _check_bounds(self, position: tuple[int, int]) -> None:
+        x, y = position
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Position ({x}, {y}) is outside {self.width}x{self.height}")
+
+    # --Plots
+    def crop(self, plot_x: int, plot_y: int, plots_wide: int, plots_high: int) -> None:
+        '''
+        Keep only a rectangle of plots, shifting every position so the
+        rectangle becomes the new origin; clears the journal
+        '''
+        grid_wide, grid_high = self.plot_grid
+        if not (
+            0 <= plot_x and 0 < plots_wide and plot_x + plots_wide <= grid_wide
+            and 0 <= plot_y and 0 < plots_high and plot_y + plots_high <= grid_high
+        ):
+            raise IndexError(
+                f"Plot rectangle ({plot_x}, {plot_y}, {plots_wide}, {plots_high}) "
+                f"is outside the {grid_wide}x{grid_high} plot grid"
+            )
+        offset = (-plot_x * Plot.Width, -plot_y * Plot.Height)
+        size = (plots_wide * Plot.Width, plots_high * Plot.Height)
+        player = (self.player.x + offset[0], self.player.y + offset[1])
+        if not (0 <= player[0] < size[0] and 0 <= player[1] < size[1]):
+            raise ValueError(f"Player at {self.player.position} is outside the cropped plots")
+        plots: list[Plot] = []
+        for row in range(plot_y, plot_y + plots_high):
+            start: int = row * grid_wide + plot_x
+            plots.extend(self.plots[start:start + plots_wide])
+        self._replace_plots(size, tuple(plots), offset)
+
+    def extend(
+        self, left: int = 0, top: int = 0, right: int = 0, bottom: int = 0,
+        fill: int = 0, visible: bool = False
+    ) -> None:
+        '''
+        Add rows/columns of new plots filled with a tile id on any side,
+        shifting every position by the plots added left and above; clears the journal
+        '''
+        if min(left, top, right, bottom) < 0:
+            raise ValueError("Plot counts to extend by must not be negative")
+        grid_wide, grid_high = self.plot_grid
+        new_wide: int = left + grid_wide + right
+        new_high: int = top + grid_high + bottom
+        plots: list[Plot] = []
+        for row in range(new_high):
+            if top <= row < top + grid_high:
+                start: int = (row - top) * grid_wide
+                plots.extend(Plot.filled(visible, fill) for _ in range(left))
+                plots.extend(self.plots[start:start + grid_wide])
+                plots.extend(Plot.filled(visible, fill) for _ in range(right))
+            else:
+                plots.extend(Plot.filled(visible, fill) for _ in range(new_wide))
+        self._replace_plots(
+            (new_wide * Plot.Width, new_high * Plot.Height), tuple(plots),
+            (left * Plot.Width, top * Plot.Height)
+        )
+
+    def merge(
+        self, other: World, source: tuple[int, int, int, int], target: tuple[int, int]
+    ) -> None:
+        '''
+        Replace plots starting at target (plot X,Y) with the source rectangle
+        (plot X,Y,wide,high) of another world; objects on the replaced plots
+        are dropped and incoming uids that clash are reissued. Bee references
+        to objects left behind or dropped are cleared. The plots are moved, not
+        copied: `other` gets blank grass plots in their place
+        '''
+        if other is self:
+            raise ValueError("Cannot merge plots of a world into itself")
+        plot_x, plot_y, plots_wide, plots_high = source
+        other_wide, other_high = other.plot_grid
+        grid_wide, grid_high = self.plot_grid
+        if not (
+            0 <= plot_x and 0 < plots_wide and plot_x + plots_wide <= other_wide
+            and 0 <= plot_y and 0 < plots_high and plot_y + plots_high <= other_high
+        ):
+            raise IndexError(
+                f"Source plots {source} are outside the {other_wide}x{other_high} plot grid"
+            )
+        if not (
+            0 <= target[0] and target[0] + plots_wide <= grid_wide
+            and 0 <= target[1] and target[1] + plots_high <= grid_high
+        ):
+            raise IndexError(
+                f"Target plots at {target} do not fit the {grid_wide}x{grid_high} plot grid"
+            )
+        plots: list[Plot] = list(self.plots)
+        remaining: list[Plot] = list(other.plots)
+        incoming: list[Plot] = []
+        for row in range(plots_high):
+            source_start: int = (plot_y + row) * other_wide + plot_x
+            target_start: int = (target[1] + row) * grid_wide + target[0]
+            rows: tuple[Plot, ...] = other.plots[source_start:source_start + plots_wide]
+            plots[target_start:target_start + plots_wide] = rows
+            remaining[source_start:source_start + plots_wide] = (
+                Plot.filled(False, 0) for _ in range(plots_wide)
+            )
+            incoming.extend(rows)
+        # -Reissue clashing uids among the objects that are kept
+        moved: set[int] = { id(plot) for plot in incoming }
+        kept: set[int] = { self.player.uid }
+        for plot in plots:
+            if id(plot) not in moved:
+                kept.update(obj.uid for tile in plot.tiles for obj in tile.objects)
+        moved_uids: dict[int, int] = {}
+        for plot in incoming:
+            for tile in plot.tiles:
+                for obj in tile.objects:
+                    uid: int = obj.uid
+                    if obj.uid in kept:
+                        obj.uid = GameObject.get_uid()
+                    moved_uids[uid] = obj.uid
+                    kept.add(obj.uid)
+        # -Follow reissued uids and drop references to objects left in `other`
+        for plot in incoming:
+            for tile in plot.tiles:
+                for obj in tile.objects:
+                    for _property in getattr(obj, 'properties', ()):
+                        if not isinstance(_property, TreeProperty):
+                            continue
+                        if _property.bee_uid in moved_uids:
+                            _property.bee_uid = moved_uids[_property.bee_uid]
+                        elif _property.bee_uid in other._index:
+                            _property.bee_uid = None
+        self._replace_plots(self.size, tuple(plots), (0, 0))
+        other._replace_plots(other.size, tuple(remaining), (0, 0))
+
+    def _replace_plots(
+        self, size: tuple[int, int], plots: tuple[Plot, ...], offset: tuple[int, int]
+    ) -> None:
+        '''
+        Swap in a new plot grid, shifting player/spawn by offset and reindexing;
+        bee references from surviving objects to dropped objects are cleared
+        '''
+        previous: dict[int, tuple[Structure | GameObject, tuple[int, int]]] = self._index
+        self.size = size
+        self.plots = plots
+        self.player.position = (self.player.x + offset[0], self.player.y + offset[1])
+        spawn = (self.spawn[0] + offset[0], self.spawn[1] + offset[1])
+        if not (0 <= spawn[0] < size[0] and 0 <= spawn[1] < size[1]):
+            spawn = self.player.position
+        self.spawn = spawn
+        self._build_index()
+        for uid, (obj, _) in self._index.items():
+            if previous.get(uid, (None,))[0] is not obj:
+                continue
+            for _property in getattr(obj, 'properties', ()):
+                if (
+                    isinstance(_property, TreeProperty)
+                    and _property.bee_uid in previous
+                    and self._index.get(_property.bee_uid, (None,))[0]
+                    is not previous[_property.bee_uid][0]
+                ):
+                    _property.bee_uid = None
+        self.journal.clear()
+
+    # --Journal
+    def undo(self, steps: int = 1) -> int:
+        return self.journal.undo(self, steps)
+
+    def redo(self, steps: int = 1) -> int:
+        return self.journal.redo(self, steps)
+
+    def checkpoint(self, name: str) -> None:
+        self.journal.checkpoint(name)
+
+    def rollback(self, name: str) -> None:
+        self.journal.rollback(self, name)
+
+    def _record(self, operation: Operation) -> None:
+        operation.apply(self)
+        self.journal.record(operation)
+
+    # --Objects (unjournaled)
+    def _claim_uids(self) -> None:
+        '''Claim every uid in the world, including carried items and ingredients'''
+        highest: int = self.player.uid
+        for items in (
+            self.player.hands, self.player.backpack,
+            self.player.upgrades, self.player.clothes
+        ):
+            for item in items:
+                highest = max(highest, item.uid)
+        for uid, (obj, _) in self._index.items():
+            highest = max(highest, uid)
+            for _property in getattr(obj, 'properties', ()):
+                highest = max(highest, getattr(_property, 'highest_uid', 0))
+        GameObject.claim_uid(highest)
+
+    def _build_index(self) -> None:
+        '''Map every tile object uid to the object and its tile position'''
+        self._index = {}
+        self._structures = {}
+        plots_wide: int = self.width // Plot.Width
+        for i, plot in enumerate(self.plots):
+            origin_x: int = (i % plots_wide) * Plot.Width
+            origin_y: int = (i // plots_wide) * Plot.Height
+            for j, tile in enumerate(plot.tiles):
+                if not tile.objects:
+                    continue
+                position = (origin_x + j % Plot.Width, origin_y + j // Plot.Width)
+                for obj in tile.objects:
+                    self._index[obj.uid] = (obj, position)
+                    if isinstance(obj, Structure):
+                        obj.position = position
+                        self._structures.setdefault(obj.id, {})[obj.uid] = obj
+
+    def _locate(self, uid: int) -> tuple[Structure | GameObject, tuple[int, int]]:
+        try:
+            return self._index[uid]
+        except KeyError:
+            raise KeyError(f"No object with uid {uid}") from None
+
+    def _insert(
+        self, obj: Structure | GameObject, position: tuple[int, int],
+        index: int | None = None
+    ) -> None:
+        '''Attach an object to a tile, at `index` in its object list or last'''
+        objects: list[Structure | GameObject] = self[position].objects
+        if index is None:
+            objects.append(obj)
+        else:
+            objects.insert(index, obj)
+        self._index[obj.uid] = (obj, position)
+        if isinstance(obj, Structure):
+            obj.position = position
+            self._structures.setdefault(obj.id, {})[obj.uid] = obj
+
+    def _extract(self, obj: Structure | GameObject) -> int:
+        '''Detach an object from its tile; returns where it was in the tile's object list'''
+        objects: list[Structure | GameObject] = self[self._locate(obj.uid)[1]].objects
+        index: int = next((i for i, other in enumerate(objects) if other is obj), -1)
+        if index == -1:
+            raise ValueError(f"Object {obj!r} is not on its indexed tile")
+        del objects[index]
+        del self._index[obj.uid]
+        if isinstance(obj, Structure):
+            del self._structures[obj.id][obj.uid]
+        return index
+
+    def _place(
+        self, obj: Player | Structure | GameObject, position: tuple[int, int],
+        index: int | None = None
+    ) -> int | None:
+        '''Move an object to a tile; returns where it was in its old tile's object list'''
+        if isinstance(obj, Player):
+            obj.position = position
+            return None
+        previous: int = self._extract(obj)
+        self._insert(obj, position, index)
+        return previous
+
     # -Class Methods
     @classmethod
     def from_dict(cls, data: dict) -> World:
@@ -124,46 +621,36 @@ class World:
         seed: int = _options['Seed']
         gamemode: Gamemode = Gamemode(_options['GameModeName'])
         spawn: tuple[int, int] = (_options['StartPositionX'], _options['StartPositionY'])
-        # --Flags
-        flags: GameOptions = GameOptions(0)
-        if _options['BadgeUnlocksEnabled']:
-            flags |= GameOptions.BadgeUnlocks
-        if _options['BotLimitEnabled']:
-            flags |= GameOptions.BotLimit
-        if _options['BotRechargingEnabled']:
-            flags |= GameOptions.BotRecharging
-        if _options['RandomObjectsEnabled']:
-            flags |= GameOptions.RandomObjects
-        if _options['RecordingEnabled']:
-            flags |= GameOptions.Recording
-        if _options['TutorialEnabled']:
-            flags |= GameOptions.Tutorial
+        flags: GameOptions = GameOptions.from_dict(_options)
         # -Tiles
         _tiles = data['Tiles']
         size: tuple[int, int] = (_tiles['TilesWide'], _tiles['TilesHigh'])
         tiles: tuple[Tile, ...] = tuple(
             Tile(_id) for _id in decompress_tile_ids(_tiles['TileTypes'])
         )
-        assert len(tiles) == size[0] * size[1]
+        if len(tiles) != size[0] * size[1]:
+            raise ValueError(
+                f"Tile runs expand to {len(tiles)} tiles, expected {size[0] * size[1]}"
+            )
         # --Objects
         player: Player
-        counter: int = 0
         for obj in data['Objects']:
             (x, y), _obj = load_game_object(obj)
             if isinstance(_obj, Player):
                 player = _obj
                 continue
-            elif isinstance(_obj, Structure):
-                counter += 1
             idx: int = x + y * size[0]
             tiles[idx].objects.append(_obj)
-        print(f"Total structures: {counter}")
         # --Plots
         plots: tuple[Plot, ...] = tuple(
             Plot.from_index(i, size, bool(visible), tiles)
             for i, visible in enumerate(data['Plots']['PlotsVisible'])
         )
-        assert len(plots) == (size[0] // Plot.Width) * (size[1] // Plot.Height)
+        if len(plots) != (size[0] // Plot.Width) * (size[1] // Plot.Height):
+            raise ValueError(
+                f"Save has {len(plots)} plots, expected "
+                f"{(size[0] // Plot.Width) * (size[1] // Plot.Height)}"
+            )
         return cls(name, size, seed, gamemode, spawn, flags, plots, player)
 
     @classmethod
@@ -172,7 +659,30 @@ class World:
             data = json.load(f)
         return cls.from_dict(data)
 
+    @classmethod
+    async def aload(
+        cls, file: Path, executor: Executor | None = None,
+        limit: asyncio.Semaphore | None = None
+    ) -> World:
+        '''
+        Load without blocking the event loop: the read runs in a thread and
+        parsing/building in `executor`; cancellation takes effect between phases
+        and a cancelled load keeps its slot until the running phase finishes
+        '''
+        async with limit if limit is not None else _default_limit():
+            text: str = await _run_to_completion(None, file.read_text)
+            data: dict = await _run_to_completion(executor, json.loads, text)
+            world: World = await _run_to_completion(executor, cls.from_dict, data)
+        # -A process pool claims uids in the child; claim them here too
+        world._claim_uids()
+        return world
+
     # -Properties
+    @property
+    def plot_grid(self) -> tuple[int, int]:
+        '''Number of plots across and down'''
+        return (self.width // Plot.Width, self.height // Plot.Height)
+
     @property
     def tile_count(self) -> int:
         return self.width * self.height
@@ -185,6 +695,9 @@ class World:
     def width(self) -> int:
         return self.size[0]
 
+    # -Class Properties
+    AsyncLimit: ClassVar[int] = 4
+
 
 class Gamemode(Enum):
     Campaign = "ModeCampaign"
@@ -200,3 +713,22 @@ class GameOptions(Flag):
     RandomObjects = auto()
     Recording = auto()
     Tutorial = auto()
+
+    # -Class Methods
+    @classmethod
+    def from_dict(cls, data: dict) -> GameOptions:
+        '''Load flags from the save's GameOptions'''
+        flags: GameOptions = cls(0)
+        if data['BadgeUnlocksEnabled']:
+            flags |= cls.BadgeUnlocks
+        if data['BotLimitEnabled']:
+            flags |= cls.BotLimit
+        if data['BotRechargingEnabled']:
+            flags |= cls.BotRecharging
+        if data['RandomObjectsEnabled']:
+            flags |= cls.RandomObjects
+        if data['RecordingEnabled']:
+            flags |= cls.Recording
+        if data['TutorialEnabled']:
+            flags |= cls.Tutorial
+        return flags